@@ -4,36 +4,441 @@
 import io
 import os
 import re
+import copy
+import functools
 import json
+import mmap
 import hashlib
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 import numpy as np
 from PIL import Image
-import cairosvg
+import cairocffi
+from cairosvg.parser import Tree
+from cairosvg.surface import PNGSurface
 import torch
 import folder_paths
+import comfy.model_management
 
+try:
+    # Optional: resvg is considerably faster than CairoSVG when available.
+    import resvg_py
+except ImportError:
+    resvg_py = None
 
-def _pil_to_tensor(pil_img: Image.Image):
+try:
+    # Optional: multithreaded pixel conversion for large images
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+_HEX6_RE = re.compile(r'#[A-Fa-f0-9]{6}')
+
+# Comments and CDATA sections, each matching only up to its own terminator
+_COMMENT_PATTERN = rb'<!--(?:(?!-->).)*-->'
+_CDATA_PATTERN = rb'<!\[CDATA\[(?:(?!\]\]>).)*\]\]>'
+
+
+def _block_pattern(name):
+    """
+    Regex for a whole `name` element, either self-closing or with its content.
+    Quoted attribute values may contain '>', and comments or CDATA inside the
+    content may contain the closing tag. A nested `name` element ends the scan,
+    so only the innermost one is removed.
+    """
+    tag = re.escape(name)
+    attrs = rb'(?:[^>"\']|"[^"]*"|\'[^\']*\')*'
+    content = (
+        rb'(?:[^<]|' + _COMMENT_PATTERN + rb'|' + _CDATA_PATTERN +
+        rb'|<(?!/?' + tag + rb'[\s/>]|!--|!\[CDATA\[))*'
+    )
+    return (
+        rb'<' + tag + rb'(?=[\s/>])' + attrs + rb'/>'
+        rb'|<' + tag + rb'(?=[\s/>])' + attrs + rb'>' + content + rb'</' + tag + rb'\s*>'
+    )
+
+
+# Metadata and Inkscape namedview blocks never render, but every element in them
+# still becomes a CairoSVG node that goes through the CSS cascade. CDATA sections
+# and comments are matched first and kept as-is, so their text is never touched.
+_NON_RENDERING_RE = re.compile(
+    rb'(' + _CDATA_PATTERN + rb'|' + _COMMENT_PATTERN + rb')'
+    rb'|' + _block_pattern(b'metadata') +
+    rb'|' + _block_pattern(b'sodipodi:namedview'),
+    re.DOTALL,
+)
+
+
+def _strip_non_rendering(svg_bytes):
+    """Remove metadata and namedview blocks from SVG source."""
+    return _NON_RENDERING_RE.sub(lambda m: m.group(1) or b'', svg_bytes)
+
+
+class _LRUCache:
+    """
+    Small thread-safe LRU mapping, bounded by entry count and optionally by the
+    total `nbytes` of the entries.
+    """
+
+    def __init__(self, maxsize, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, nbytes=0):
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            # Too large to keep around at all
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._data[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while len(self._data) > self.maxsize or (
+                self.max_bytes is not None and self._nbytes > self.max_bytes
+            ):
+                _, (_, evicted_nbytes) = self._data.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+
+
+# Parsed SVG trees keyed by a digest of the source, and finished renders keyed
+# by (digest, background, resize options). Both are also capped by memory:
+# renders are full-resolution pixel arrays, and a parsed tree keeps the XML tree
+# plus a Python object per node, estimated at a multiple of the source size.
+_TREE_CACHE = _LRUCache(maxsize=16, max_bytes=256 * 1024 * 1024)
+_TREE_BYTES_PER_SOURCE_BYTE = 20
+_RENDER_CACHE = _LRUCache(maxsize=8, max_bytes=256 * 1024 * 1024)
+
+
+def _svg_digest(svg_bytes):
+    return hashlib.blake2b(svg_bytes, digest_size=16).digest()
+
+
+def _clone_tree(node, parent=None):
+    """Copy the node structure of a parsed tree, sharing the parsed attributes."""
+    clone = copy.copy(node)
+    if parent is not None:
+        clone.parent = parent
+    clone.children = [_clone_tree(child, clone) for child in node.children]
+    return clone
+
+
+def _parse_svg_tree(svg_bytes, digest):
+    """
+    Return the cached CairoSVG tree for `svg_bytes`, parsing it only on a cache miss.
+    The returned tree is shared and must not be drawn; use _get_svg_tree for that.
+    """
+    tree = _TREE_CACHE.get(digest)
+    if tree is None:
+        tree = Tree(bytestring=_strip_non_rendering(svg_bytes))
+        _TREE_CACHE.put(digest, tree, nbytes=len(svg_bytes) * _TREE_BYTES_PER_SOURCE_BYTE)
+    return tree
+
+
+def _get_svg_tree(svg_bytes, digest):
+    """
+    Return a CairoSVG tree for `svg_bytes` to draw, parsing it only on a cache miss.
+    """
+    # CairoSVG rewrites masks, patterns and <use> nodes while drawing, so each
+    # render gets its own copy of the cached tree.
+    return _clone_tree(_parse_svg_tree(svg_bytes, digest))
+
+
+def _surface_to_rgba(cairo_surface):
+    """
+    Copy a Cairo ARGB32 image surface into an (H, W, 4) uint8 RGBA array.
+    """
+    cairo_surface.flush()
+    size = (cairo_surface.get_width(), cairo_surface.get_height())
+    # Cairo stores native-endian premultiplied ARGB, i.e. BGRA bytes on little-endian
+    # hosts. Pillow's "BGRa" raw mode reorders and un-premultiplies in one C pass.
+    pil_image = Image.frombuffer(
+        "RGBA", size, cairo_surface.get_data(), "raw", "BGRa", cairo_surface.get_stride(), 1
+    )
+    return np.asarray(pil_image)
+
+
+def _render_with_resvg(svg_text, background_color=None, output_width=None, scale=None):
+    """
+    Rasterize SVG text with resvg to an RGBA array, or return None when resvg
+    is not installed or cannot handle the document.
+    """
+    if resvg_py is None:
+        return None
+    try:
+        png_bytes = resvg_py.svg_to_bytes(
+            svg_string=svg_text,
+            background=background_color,
+            width=output_width,
+            zoom=scale,
+        )
+    except ValueError:
+        # resvg raises ValueError for documents it cannot parse or render; let the
+        # caller fall back to CairoSVG. Other errors (e.g. an API change) propagate.
+        return None
+    # resvg only exposes encoded PNG output
+    pil_image = Image.open(io.BytesIO(bytes(png_bytes)))
+    if pil_image.mode != "RGBA":
+        pil_image = pil_image.convert("RGBA")
+    return np.asarray(pil_image)
+
+
+class _TilePNGSurface(PNGSurface):
+    """
+    A PNGSurface that only draws one horizontal band of the full output:
+    rows [height * tile_index // tile_count, height * (tile_index + 1) // tile_count).
+    """
+
+    def __init__(self, *args, tile_index, tile_count, **kwargs):
+        self._tile_index = tile_index
+        self._tile_count = tile_count
+        super().__init__(*args, **kwargs)
+
+    def _create_surface(self, width, height):
+        width = int(round(width))
+        height = int(round(height))
+        tile_top = height * self._tile_index // self._tile_count
+        tile_bottom = height * (self._tile_index + 1) // self._tile_count
+        cairo_surface = cairocffi.ImageSurface(cairocffi.FORMAT_ARGB32, width, tile_bottom - tile_top)
+        # Shift at the device level so this band's rows land on the surface. A context
+        # transform would be reapplied by every nested <svg> and <use> of a symbol.
+        cairo_surface.set_device_offset(0, -tile_top)
+        # Report the full size so the SVG is laid out exactly as in a single render
+        return cairo_surface, width, height
+
+
+# Outputs are rendered as horizontal tiles in parallel, one per this many pixels.
+# Every tile repeats CairoSVG's Python drawing pass, which grows with the source
+# size, so only outputs with many pixels per source byte are tiled: there the
+# rasterization that tiling splits up outweighs the repeated drawing.
+_TILE_MIN_PIXELS = 4_000_000
+_TILE_MIN_PIXELS_PER_BYTE = 1000
+_MAX_TILES = 8
+
+
+_SVG_START_TAG_RE = re.compile(rb'<svg\b[^>]*>')
+_SIZE_ATTR_RES = {
+    name: re.compile(rb'\s' + name.encode() + rb'\s*=\s*["\']([^"\']*)["\']')
+    for name in ("width", "height", "viewBox")
+}
+
+
+def _sniff_aspect_ratio(svg_bytes):
+    """
+    Height / width of an SVG read from its root <svg> tag within the first 4 KiB,
+    or None when it cannot be read without a full parse.
+    """
+    match = _SVG_START_TAG_RE.search(svg_bytes, 0, 4096)
+    if match is None:
+        return None
+    attrs = {}
+    for name, pattern in _SIZE_ATTR_RES.items():
+        attr = pattern.search(match.group())
+        if attr is not None:
+            attrs[name] = attr.group(1).decode("utf-8", "replace")
+    try:
+        width = float(attrs["width"].strip().removesuffix("px"))
+        height = float(attrs["height"].strip().removesuffix("px"))
+    except (KeyError, ValueError):
+        viewbox = attrs.get("viewBox", "").replace(",", " ").split()
+        try:
+            width, height = float(viewbox[2]), float(viewbox[3])
+        except (IndexError, ValueError):
+            return None
+    if width <= 0 or height <= 0:
+        return None
+    return height / width
+
+
+def _tile_count(svg_bytes, output_width=None):
+    """Number of horizontal tiles to render the output with."""
+    if not output_width:
+        return 1
+    aspect_ratio = _sniff_aspect_ratio(svg_bytes)
+    if aspect_ratio is None:
+        return 1
+    pixels = output_width * output_width * aspect_ratio
+    if pixels < _TILE_MIN_PIXELS_PER_BYTE * len(svg_bytes):
+        return 1
+    return max(1, min(os.cpu_count() or 1, _MAX_TILES, int(pixels // _TILE_MIN_PIXELS)))
+
+
+def _render_tile(svg_bytes, digest, tile_index, tile_count, background_color=None, **resize_kwargs):
+    """Rasterize one horizontal tile of the output to an RGBA array."""
+    tree = _get_svg_tree(svg_bytes, digest)
+    surface = _TilePNGSurface(
+        tree, None, 96,
+        background_color=background_color,
+        tile_index=tile_index,
+        tile_count=tile_count,
+        **resize_kwargs,
+    )
+    return _surface_to_rgba(surface.cairo)
+
+
+def _render_with_cairosvg(svg_bytes, digest, background_color=None, tile=True, **resize_kwargs):
+    """
+    Rasterize SVG bytes with CairoSVG straight to an RGBA array. With tile=False
+    the output is always rendered in one piece, e.g. when already on a worker thread.
     """
-    Convert PIL image to ComfyUI IMAGE tensor: (B, H, W, C) in [0,1]
+    tile_count = _tile_count(svg_bytes, resize_kwargs.get("output_width")) if tile else 1
+    if tile_count > 1:
+        # Parse once up front; otherwise every tile thread would miss the cold
+        # cache together and parse the document itself under the GIL
+        _parse_svg_tree(svg_bytes, digest)
+        # Tiles are independent; Cairo drops the GIL while drawing each of them
+        with ThreadPoolExecutor(max_workers=tile_count) as executor:
+            tiles = executor.map(
+                lambda i: _render_tile(svg_bytes, digest, i, tile_count, background_color, **resize_kwargs),
+                range(tile_count),
+            )
+            return np.concatenate(list(tiles), axis=0)
+    tree = _get_svg_tree(svg_bytes, digest)
+    surface = PNGSurface(tree, None, 96, background_color=background_color, **resize_kwargs)
+    return _surface_to_rgba(surface.cairo)
+
+
+def _render_svg(svg_text, background_color=None, tile=True, **resize_kwargs):
+    """
+    Rasterize SVG text to an (H, W, 4) uint8 RGBA array, reusing cached parses
+    and renders. Uses resvg when available and falls back to CairoSVG.
+    tile=False disables CairoSVG's tiled rendering; the result is the same.
+    The returned array may be shared with the cache and must not be modified.
+    """
+    svg_bytes = svg_text.encode("utf-8")
+    digest = _svg_digest(svg_bytes)
+    key = (digest, background_color, tuple(sorted(resize_kwargs.items())))
+    rgba = _RENDER_CACHE.get(key)
+    if rgba is None:
+        rgba = _render_with_resvg(svg_text, background_color, **resize_kwargs)
+        if rgba is None:
+            rgba = _render_with_cairosvg(svg_bytes, digest, background_color, tile=tile, **resize_kwargs)
+        _RENDER_CACHE.put(key, rgba, nbytes=rgba.nbytes)
+    return rgba
+
+
+# Below this many pixels the parallel kernel's thread launch costs more than it saves
+_NUMBA_MIN_PIXELS = 1_000_000
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _scale_pixels(src, dst):
+        """Write uint8 pixels into a float32 array scaled to [0,1], rows in parallel."""
+        inv = np.float32(1.0 / 255.0)
+        for y in prange(src.shape[0]):
+            for x in range(src.shape[1]):
+                for c in range(src.shape[2]):
+                    dst[y, x, c] = src[y, x, c] * inv
+else:
+    _scale_pixels = None
+
+
+def _new_image_tensor(batch_size, height, width, channels=4):
     """
-    # Keep 4 channels for PNG if present, else 3
-    if pil_img.mode not in ("RGBA", "RGB"):
-        pil_img = pil_img.convert("RGBA")
-    arr = np.array(pil_img).astype(np.float32) / 255.0
-    if arr.ndim == 2:
-        arr = np.stack([arr] * 3, axis=-1)
-    # batch dimension
-    return torch.from_numpy(np.expand_dims(arr, 0))
+    Allocate an uninitialized ComfyUI IMAGE tensor on the intermediate device.
+
+    IMAGE tensors are contiguous (B, H, W, C) float32, which is the layout every
+    ComfyUI image node indexes and the one its preview/save nodes convert from.
+    Images are written straight into their slot of this tensor, so no batch
+    reshape or .contiguous() copy is needed afterwards.
+    """
+    return torch.empty(
+        (batch_size, height, width, channels),
+        dtype=torch.float32,
+        device=comfy.model_management.intermediate_device(),
+    )
+
+
+def _write_image(arr, out):
+    """
+    Write an (H, W, C) uint8 array into an (H, W, C) float32 tensor, scaled to [0,1].
+    """
+    if out.device.type != "cpu":
+        # Upload the uint8 pixels (a quarter of the float32 size) and scale on the device
+        with warnings.catch_warnings():
+            # Rendered arrays are read-only views; the wrapping tensor is only read from
+            warnings.filterwarnings("ignore", message="The given buffer is not writable")
+            pixels = torch.frombuffer(np.ascontiguousarray(arr), dtype=torch.uint8)
+        out.copy_(pixels.view(arr.shape).to(out.device, non_blocking=True))
+        out.mul_(1.0 / 255.0)
+    elif _scale_pixels is not None and arr.shape[0] * arr.shape[1] >= _NUMBA_MIN_PIXELS:
+        # Always pass a read-only C-contiguous array, so numba compiles a single
+        # specialization whether the pixels come from the cache or a fresh border
+        src = np.ascontiguousarray(arr).view()
+        src.flags.writeable = False
+        _scale_pixels(src, out.numpy())
+    else:
+        # Cast and scale in a single pass over the pixels
+        np.multiply(arr, np.float32(1.0 / 255.0), out=out.numpy(), casting="unsafe")
+    return out
+
+
+def _array_to_tensor(arr):
+    """
+    Convert an (H, W, C) uint8 array to ComfyUI IMAGE tensor: (B, H, W, C) in [0,1]
+    """
+    out = _new_image_tensor(1, *arr.shape)
+    _write_image(arr, out[0])
+    return out
+
+
+# file path -> (mtime, size, digest) of the last IS_CHANGED hash
+_HASH_CACHE = {}
+
+
+def _hash_file(path):
+    """
+    SHA-256 hex digest of a file, hashed straight from a read-only memory map.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+# input directory -> (directory mtime, sorted SVG file names)
+_SVG_LIST_CACHE = {}
+
+
+def _list_svg_files(input_dir):
+    """
+    List the SVG files in `input_dir`, rescanning only when the directory changes.
+    """
+    mtime_ns = os.stat(input_dir).st_mtime_ns
+    cached = _SVG_LIST_CACHE.get(input_dir)
+    if cached is None or cached[0] != mtime_ns:
+        # DirEntry.is_file() reuses the type from the directory listing, no stat per file
+        with os.scandir(input_dir) as entries:
+            files = sorted(e.name for e in entries if e.name.lower().endswith('.svg') and e.is_file())
+        cached = (mtime_ns, files)
+        _SVG_LIST_CACHE[input_dir] = cached
+    return list(cached[1])
+
 
 class LoadSVGImage:
     @classmethod
     def INPUT_TYPES(s):
         input_dir = folder_paths.get_input_directory()
-        files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f)) and f.lower().endswith('.svg')]
+        files = _list_svg_files(input_dir)
         return {
             "required": {
-                "svg": (sorted(files), {"image_upload": True}),
+                "svg": (files, {"image_upload": True}),
             }
         }
 
@@ -49,18 +454,20 @@ class LoadSVGImage:
             svg_text = f.read()
         
         # Generate preview with a fixed width, preserving aspect ratio
-        png_bytes = cairosvg.svg2png(bytestring=svg_text.encode("utf-8"))
-        pil_preview = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
+        rgba = _render_svg(svg_text)
         
-        return (svg_text, _pil_to_tensor(pil_preview))
+        return (svg_text, _array_to_tensor(rgba))
 
     @classmethod
     def IS_CHANGED(s, svg):
         svg_path = folder_paths.get_annotated_filepath(svg)
-        m = hashlib.sha256()
-        with open(svg_path, 'rb') as f:
-            m.update(f.read())
-        return m.digest().hex()
+        st = os.stat(svg_path)
+        cached = _HASH_CACHE.get(svg_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        digest = _hash_file(svg_path)
+        _HASH_CACHE[svg_path] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
 
     @classmethod
     def VALIDATE_INPUTS(s, svg):
@@ -113,21 +520,16 @@ class RasterizeSVG:
         br_color = self._parse_hex_color_string(border_color, "Border color")
         resize_kwargs = self._get_resize_kwargs(width, scale)                
         
-        png_bytes = cairosvg.svg2png(
-            bytestring=svg_text.encode("utf-8"),
-            background_color=bg_color,
-            **resize_kwargs
-        )
-        pil_image = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
+        rgba = _render_svg(svg_text, background_color=bg_color, **resize_kwargs)
 
         if border_width > 0:
             # Add a border around the image
-            pil_image = self._add_border(pil_image, border_width, br_color)
+            rgba = self._add_border(rgba, border_width, br_color)
         
-        return (_pil_to_tensor(pil_image),)
+        return (_array_to_tensor(rgba),)
      
     def _get_resize_kwargs(self, width, scale):
-        """Get the resize kwargs for the cairosvg.svg2png function."""
+        """Get the resize kwargs for the CairoSVG PNG surface."""
         resize_kwargs = {}
         if width > 0:
             resize_kwargs["output_width"] = width
@@ -142,43 +544,119 @@ class RasterizeSVG:
         color = None
         clean_color = color_string.strip()
         if clean_color and clean_color.lower() not in ('transparent', 'none', ''):
-            if not re.match(r'^#[A-Fa-f0-9]{6}$', clean_color):
+            if _HEX6_RE.fullmatch(clean_color) is None:
                 raise ValueError(f"{field_name} must be in hexadecimal format (e.g., #RRGGBB) or 'transparent'.")
             color = clean_color
         return color
     
-    def _hex_to_rgba(self, hex_color):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _hex_to_rgba(hex_color):
         """Converts a hex color string to an (R, G, B, A) tuple."""
         hex_color = hex_color.lstrip('#')
         if len(hex_color) == 3:
-            r, g, b = tuple(int(c * 2, 16) for c in hex_color)
-        else:
-            r, g, b = tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
-        return (r, g, b, 255)
+            hex_color = ''.join(c * 2 for c in hex_color)
+        value = int(hex_color, 16)
+        return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF, 255)
     
-    def _add_border(self, pil_image, border_width, br_color):
-        original_width, original_height = pil_image.size
+    def _add_border(self, rgba, border_width, br_color):
+        """Place an (H, W, 4) RGBA array inside a solid border of `border_width` pixels."""
+        original_height, original_width = rgba.shape[:2]
         new_width = original_width + 2 * border_width
         new_height = original_height + 2 * border_width
 
-        pil_border_color = (0, 0, 0, 0)
         if br_color:
-            pil_border_color = self._hex_to_rgba(br_color)
+            # Fill only the frame, then copy the image into the middle
+            border_rgba = self._hex_to_rgba(br_color)
+            bordered = np.empty((new_height, new_width, 4), dtype=np.uint8)
+            bordered[:border_width] = border_rgba
+            bordered[-border_width:] = border_rgba
+            bordered[border_width:-border_width, :border_width] = border_rgba
+            bordered[border_width:-border_width, -border_width:] = border_rgba
+        else:
+            # A transparent frame is all zeros, which np.zeros gets from the allocator for free
+            bordered = np.zeros((new_height, new_width, 4), dtype=np.uint8)
+        bordered[border_width:-border_width, border_width:-border_width] = rgba
+        return bordered
+
+
+class RasterizeSVGBatch(RasterizeSVG):
+    """
+    A node to rasterize a list of SVG texts into a single image batch, with the
+    same options as RasterizeSVG applied to every SVG.
+
+    Inputs:
+    - svg_text: A list of SVG contents as strings.
+    - width, scale, background_color, border_width, border_color: As in RasterizeSVG.
+
+    All SVGs must rasterize to the same size, e.g. share an aspect ratio when
+    'width' is used.
+    """
+    @classmethod
+    def INPUT_TYPES(s):
+        inputs = super().INPUT_TYPES()
+        inputs["required"]["svg_text"] = ("STRING", {"forceInput": True})
+        return inputs
 
-        bordered_image = Image.new("RGBA", (new_width, new_height), pil_border_color)
-        bordered_image.paste(pil_image, (border_width, border_width), pil_image)
-        pil_image = bordered_image
-        return pil_image
+    INPUT_IS_LIST = True
+    FUNCTION = "rasterize_batch"
 
+    def rasterize_batch(self, svg_text, width, scale, background_color, border_width, border_color):
+        # With INPUT_IS_LIST every input arrives as a list; the options take their first value
+        width, scale = width[0], scale[0]
+        background_color, border_width, border_color = background_color[0], border_width[0], border_color[0]
+        if not svg_text or any(not text or not text.strip() for text in svg_text):
+            raise ValueError("SVG text is empty")
+
+        bg_color = self._parse_hex_color_string(background_color, "Background color")
+        br_color = self._parse_hex_color_string(border_color, "Border color")
+        resize_kwargs = self._get_resize_kwargs(width, scale)
+
+        # Render each distinct SVG once, in parallel; Cairo drops the GIL while drawing.
+        # The batch already fills the cores, so single renders are not tiled as well.
+        indices = {}
+        for i, text in enumerate(svg_text):
+            indices.setdefault(text, []).append(i)
+
+        out = None
+        max_workers = min(len(indices), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_render_svg, text, background_color=bg_color, tile=False, **resize_kwargs): text
+                for text in indices
+            }
+            # Write each render into the batch as soon as it finishes, overlapping the
+            # tensor conversion with the renders still in flight. On any error, drop
+            # the renders that have not started instead of waiting for them.
+            try:
+                for future in as_completed(futures):
+                    rgba = future.result()
+                    if border_width > 0:
+                        rgba = self._add_border(rgba, border_width, br_color)
+                    if out is None:
+                        out = _new_image_tensor(len(svg_text), *rgba.shape)
+                    elif rgba.shape != out.shape[1:]:
+                        raise ValueError(
+                            f"All SVGs in a batch must rasterize to the same size, got "
+                            f"{rgba.shape[1]}x{rgba.shape[0]} and {out.shape[2]}x{out.shape[1]}."
+                        )
+                    for i in indices[futures[future]]:
+                        _write_image(rgba, out[i])
+            finally:
+                for future in futures:
+                    future.cancel()
+        return (out,)
 
 
 # Required mappings for ComfyUI to discover the node
 NODE_CLASS_MAPPINGS = {
     "LoadSVGImage": LoadSVGImage,
     "RasterizeSVG": RasterizeSVG,
+    "RasterizeSVGBatch": RasterizeSVGBatch,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
     "LoadSVGImage": "Load SVG Image",
     "RasterizeSVG": "SVG Rasterizer (Simple)",
+    "RasterizeSVGBatch": "SVG Rasterizer (Batch)",
 }
@@ -0,0 +1,151 @@
+# Needs Cairo installed. Outside a ComfyUI checkout, folder_paths and
+# comfy.model_management are replaced by minimal stubs.
+
+import os
+import sys
+import tempfile
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+torch = pytest.importorskip("torch")
+pytest.importorskip("cairosvg")
+
+try:
+    import folder_paths  # noqa: F401
+except ImportError:
+    sys.modules["folder_paths"] = types.ModuleType("folder_paths")
+    sys.modules["folder_paths"].get_input_directory = tempfile.gettempdir
+
+try:
+    import comfy.model_management  # noqa: F401
+except ImportError:
+    sys.modules["comfy"] = types.ModuleType("comfy")
+    sys.modules["comfy.model_management"] = types.ModuleType("comfy.model_management")
+    sys.modules["comfy.model_management"].intermediate_device = lambda: torch.device("cpu")
+    sys.modules["comfy"].model_management = sys.modules["comfy.model_management"]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import svg2raster_node as node  # noqa: E402
+
+
+NESTED_SVG = b"""<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="0 0 100 100">
+  <defs>
+    <symbol id="sym" viewBox="0 0 10 10"><circle cx="5" cy="5" r="4" fill="#e11d48"/></symbol>
+  </defs>
+  <rect x="5" y="5" width="90" height="90" fill="#22c55e"/>
+  <svg x="10" y="40" width="50" height="50" viewBox="0 0 20 20">
+    <rect width="20" height="20" fill="#2563eb"/>
+    <circle cx="10" cy="10" r="6" fill="#facc15"/>
+  </svg>
+  <use href="#sym" x="55" y="55" width="40" height="40"/>
+  <use xlink:href="#sym" x="0" y="60" width="30" height="30"/>
+</svg>"""
+
+
+@pytest.mark.parametrize("tile_count", [2, 3, 7])
+def test_tiles_match_single_render(tile_count):
+    digest = node._svg_digest(NESTED_SVG)
+    tree = node._get_svg_tree(NESTED_SVG, digest)
+    single = node._surface_to_rgba(node.PNGSurface(tree, None, 96, output_width=301).cairo)
+
+    tiles = [
+        node._render_tile(NESTED_SVG, digest, i, tile_count, output_width=301)
+        for i in range(tile_count)
+    ]
+    tiled = np.concatenate(tiles, axis=0)
+
+    assert tiled.shape == single.shape
+    assert tiled.tobytes() == single.tobytes()
+
+
+def test_strip_keeps_cdata_and_comments():
+    svg = (
+        b"<svg><style><![CDATA[ .a{fill:red} /* <!-- */ .b{fill:blue} /* --> */ "
+        b"<metadata> ]]></style><!-- <metadata> --><rect class='b'/></svg>"
+    )
+    assert node._strip_non_rendering(svg) == svg
+
+
+def test_strip_removes_metadata_and_namedview():
+    svg = (
+        b"<svg><metadata id='m'><rdf:RDF>x</rdf:RDF></metadata><metadata/>"
+        b"<sodipodi:namedview id='n' pagecolor='#fff'/>"
+        b"<sodipodi:namedview id='n2'><inkscape:grid/></sodipodi:namedview><path d='M0 0'/></svg>"
+    )
+    assert node._strip_non_rendering(svg) == b"<svg><path d='M0 0'/></svg>"
+
+
+def test_strip_self_closing_metadata_with_gt_in_attribute():
+    svg = b"<svg><metadata title='a > b'/><rect id='keep'/><metadata>x</metadata></svg>"
+    assert node._strip_non_rendering(svg) == b"<svg><rect id='keep'/></svg>"
+
+
+def test_strip_metadata_with_closing_tag_in_comment_and_cdata():
+    svg = (
+        b"<svg><metadata><!-- </metadata> --><x/><![CDATA[ </metadata> ]]></metadata>"
+        b"<rect id='keep'/></svg>"
+    )
+    assert node._strip_non_rendering(svg) == b"<svg><rect id='keep'/></svg>"
+
+
+def test_add_border_fills_only_the_frame():
+    rgba = np.array([[[10, 20, 30, 128], [0, 0, 0, 0]]], dtype=np.uint8)
+    bordered = node.RasterizeSVG()._add_border(rgba, 2, "#ff0000")
+
+    assert bordered.shape == (5, 6, 4)
+    # Transparent and semi-transparent pixels are kept as-is, not filled or re-blended
+    assert bordered[2:-2, 2:-2].tobytes() == rgba.tobytes()
+    frame = np.ones(bordered.shape[:2], dtype=bool)
+    frame[2:-2, 2:-2] = False
+    assert (bordered[frame] == (255, 0, 0, 255)).all()
+
+
+def test_add_border_transparent():
+    rgba = np.full((3, 2, 4), 200, dtype=np.uint8)
+    bordered = node.RasterizeSVG()._add_border(rgba, 1, None)
+
+    assert bordered.shape == (5, 4, 4)
+    assert bordered[1:-1, 1:-1].tobytes() == rgba.tobytes()
+    assert bordered[0].sum() == bordered[-1].sum() == bordered[:, 0].sum() == bordered[:, -1].sum() == 0
+
+
+def _fake_render(sizes, calls):
+    """Stand-in for _render_svg returning a solid (H, W) image per SVG text."""
+    def render(svg_text, background_color=None, tile=True, **resize_kwargs):
+        calls.append(svg_text)
+        height, width = sizes[svg_text]
+        return np.full((height, width, 4), len(calls) * 50, dtype=np.uint8)
+    return render
+
+
+def _rasterize_batch(svg_text, border_width=0, border_color="transparent"):
+    return node.RasterizeSVGBatch().rasterize_batch(
+        svg_text, [64], [1.0], ["transparent"], [border_width], [border_color]
+    )[0]
+
+
+def test_batch_renders_repeated_texts_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(node, "_render_svg", _fake_render({"a": (2, 3), "b": (2, 3)}, calls))
+    out = _rasterize_batch(["a", "b", "a", "a"])
+
+    assert sorted(calls) == ["a", "b"]
+    assert out.shape == (4, 2, 3, 4)
+    assert torch.equal(out[0], out[2]) and torch.equal(out[0], out[3])
+    assert not torch.equal(out[0], out[1])
+
+
+def test_batch_size_mismatch_raises(monkeypatch):
+    monkeypatch.setattr(node, "_render_svg", _fake_render({"a": (2, 3), "b": (3, 2)}, []))
+    with pytest.raises(ValueError, match="same size"):
+        _rasterize_batch(["a", "b"])
+
+
+def test_batch_border_sizing(monkeypatch):
+    monkeypatch.setattr(node, "_render_svg", _fake_render({"a": (2, 3), "b": (2, 3)}, []))
+    out = _rasterize_batch(["a", "b"], border_width=2, border_color="#0000ff")
+
+    assert out.shape == (2, 6, 7, 4)
+    assert torch.equal(out[:, 0, 0], torch.tensor([[0.0, 0.0, 1.0, 1.0]] * 2))